@@ -67,6 +67,9 @@ class FactCheckingPipeline:
         else:
             return "Unverifiable"
 
+    def get_llm_stats(self) -> Dict:
+        return self.checker.get_client_stats()
+
     def initialize_database(self):
         self.retriever.populate_database()
 
@@ -11,3 +11,11 @@ TOP_K_FACTS = 3
 CONFIDENCE_THRESHOLD = 0.3
 
 FACT_BASE_PATH = "fact_base.csv"
+
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "30"))
+LLM_CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", "5"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "10"))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "30"))
+LLM_HTTP2 = os.getenv("LLM_HTTP2", "true").strip().lower() in ("1", "true", "yes", "on")
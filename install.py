@@ -24,6 +24,7 @@ def main():
     packages = [
         ("pip install --upgrade pip setuptools wheel", "Upgrading pip and dependencies"),
         ("pip install groq", "Installing Groq SDK"),
+        ("pip install \"httpx[http2]==0.27.2\"", "Installing HTTPX with HTTP/2 support"),
         ("pip install python-dotenv", "Installing python-dotenv"),
         ("pip install pandas", "Installing Pandas"),
         ("pip install chromadb", "Installing ChromaDB"),
@@ -0,0 +1,158 @@
+import json
+import threading
+import weakref
+import httpx
+from groq import Groq
+from config import (
+    GROQ_API_KEY,
+    LLM_TIMEOUT,
+    LLM_CONNECT_TIMEOUT,
+    LLM_MAX_RETRIES,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_KEEPALIVE_EXPIRY,
+    LLM_HTTP2,
+)
+
+_FOLLOWER_WAIT_MARGIN = 10.0
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class _InFlightCall:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SharedLLMClient:
+    def __init__(self):
+        self.http2 = LLM_HTTP2 and _http2_available()
+        self.follower_timeout = LLM_TIMEOUT * (LLM_MAX_RETRIES + 1) + _FOLLOWER_WAIT_MARGIN
+        self._stats_lock = threading.Lock()
+        self._inflight_lock = threading.Lock()
+        self._inflight = {}
+        self._seen_connections = weakref.WeakSet()
+        self._stats = {
+            "requests": 0,
+            "api_calls": 0,
+            "coalesced": 0,
+            "http_requests": 0,
+            "new_connections": 0,
+        }
+
+        self.http_client = httpx.Client(
+            http2=self.http2,
+            timeout=httpx.Timeout(LLM_TIMEOUT, connect=LLM_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=LLM_KEEPALIVE_EXPIRY
+            ),
+            event_hooks={"response": [self._track_connection]}
+        )
+        self.client = Groq(
+            api_key=GROQ_API_KEY,
+            http_client=self.http_client,
+            max_retries=LLM_MAX_RETRIES
+        )
+
+    def _track_connection(self, response):
+        stream = response.extensions.get("network_stream")
+        with self._stats_lock:
+            self._stats["http_requests"] += 1
+            if stream is not None and stream not in self._seen_connections:
+                self._seen_connections.add(stream)
+                self._stats["new_connections"] += 1
+
+    def _create(self, model: str, messages: list, **params) -> str:
+        message = self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            **params
+        )
+        return message.choices[0].message.content.strip()
+
+    def complete(self, model: str, messages: list, **params) -> str:
+        try:
+            key = json.dumps(
+                {"model": model, "messages": messages, "params": params},
+                sort_keys=True
+            )
+        except TypeError:
+            with self._stats_lock:
+                self._stats["requests"] += 1
+                self._stats["api_calls"] += 1
+            return self._create(model, messages, **params)
+
+        with self._inflight_lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = _InFlightCall()
+                self._inflight[key] = call
+
+        with self._stats_lock:
+            self._stats["requests"] += 1
+            if leader:
+                self._stats["api_calls"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            if not call.done.wait(timeout=self.follower_timeout):
+                raise TimeoutError(
+                    f"Coalesced LLM call did not finish within {self.follower_timeout:.0f}s"
+                )
+            if call.error is not None:
+                raise RuntimeError(f"Coalesced LLM call failed: {call.error!r}") from call.error
+            return call.result
+
+        try:
+            call.result = self._create(model, messages, **params)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            if call.result is None and call.error is None:
+                call.error = RuntimeError("Leader LLM call aborted")
+            with self._inflight_lock:
+                del self._inflight[key]
+            call.done.set()
+
+    def get_stats(self) -> dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+
+        stats["coalescing_ratio"] = (
+            stats["coalesced"] / stats["requests"] if stats["requests"] else 0.0
+        )
+        reused = stats["http_requests"] - stats["new_connections"]
+        stats["connection_reuse_ratio"] = (
+            reused / stats["http_requests"] if stats["http_requests"] else 0.0
+        )
+        stats["http2"] = self.http2
+        return stats
+
+    def close(self):
+        self.http_client.close()
+
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client() -> SharedLLMClient:
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = SharedLLMClient()
+        return _shared_client
@@ -1,11 +1,11 @@
 import json
-from groq import Groq
-from config import GROQ_API_KEY, LLM_MODEL, CONFIDENCE_THRESHOLD
+from llm_client import get_shared_client
+from config import LLM_MODEL, CONFIDENCE_THRESHOLD
 
 
 class FactChecker:
     def __init__(self):
-        self.client = Groq(api_key=GROQ_API_KEY)
+        self.client = get_shared_client()
         self.model = LLM_MODEL
 
     def build_verification_prompt(self, claim: str, retrieved_facts: list) -> str:
@@ -51,7 +51,7 @@ Only respond with valid JSON, no additional text."""
         prompt = self.build_verification_prompt(claim, retrieved_facts)
         
         try:
-            message = self.client.chat.completions.create(
+            response_text = self.client.complete(
                 model=self.model,
                 messages=[
                     {
@@ -63,8 +63,6 @@ Only respond with valid JSON, no additional text."""
                 max_tokens=500
             )
             
-            response_text = message.choices[0].message.content.strip()
-            
             result = json.loads(response_text)
             
             result["evidence"] = retrieved_facts
@@ -103,7 +101,7 @@ Example output:
 ["claim 1", "claim 2", "claim 3"]"""
         
         try:
-            message = self.client.chat.completions.create(
+            response_text = self.client.complete(
                 model=self.model,
                 messages=[
                     {
@@ -114,8 +112,6 @@ Example output:
                 temperature=0.3,
                 max_tokens=300
             )
-            
-            response_text = message.choices[0].message.content.strip()
             claims = json.loads(response_text)
             
             if isinstance(claims, list):
@@ -126,3 +122,6 @@ Example output:
         except Exception as e:
             print(f"Error extracting claims: {e}")
             return [text]
+
+    def get_client_stats(self) -> dict:
+        return self.client.get_stats()
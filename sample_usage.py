@@ -53,6 +53,13 @@ def main():
             json.dump(result, f, indent=2)
         print(f"[OK] Result saved to {save_filename}")
 
+    stats = pipeline.get_llm_stats()
+    print("\n[STATS] LLM client")
+    print(f"  Requests: {stats['requests']} ({stats['api_calls']} API calls, {stats['coalesced']} coalesced)")
+    print(f"  Coalescing ratio: {stats['coalescing_ratio']:.1%}")
+    print(f"  Connection reuse: {stats['connection_reuse_ratio']:.1%} ({stats['new_connections']} connections for {stats['http_requests']} HTTP requests)")
+    print(f"  HTTP/2: {stats['http2']}")
+
 
 if __name__ == "__main__":
     main()
@@ -217,6 +217,17 @@ def main():
         except:
             st.metric("Facts in Database", "N/A")
 
+        st.markdown("### 🔌 LLM Client")
+
+        llm_stats = pipeline.get_llm_stats()
+        st.metric("LLM Requests", llm_stats["requests"])
+        st.metric("Coalesced", f"{llm_stats['coalesced']} ({llm_stats['coalescing_ratio']:.1%})")
+        st.metric("Connection Reuse", f"{llm_stats['connection_reuse_ratio']:.1%}")
+        st.caption(
+            f"{llm_stats['api_calls']} API calls · {llm_stats['new_connections']} connections "
+            f"for {llm_stats['http_requests']} HTTP requests · HTTP/2: {'on' if llm_stats['http2'] else 'off'}"
+        )
+
         st.markdown("### 🎯 Verdicts")
         st.markdown("- **✅ True**: Claim is supported by retrieved facts")
         st.markdown("- **❌ False**: Claim contradicts retrieved facts")
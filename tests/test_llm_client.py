@@ -0,0 +1,205 @@
+import os
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_client import SharedLLMClient
+
+
+class BlockingCreate:
+    def __init__(self, error=None):
+        self.calls = 0
+        self.release = threading.Event()
+        self.error = error
+        self._lock = threading.Lock()
+
+    def __call__(self, model, messages, **params):
+        with self._lock:
+            self.calls += 1
+        self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        content = f" {model}:{messages[0]['content']}:{params.get('temperature')} "
+        message = types.SimpleNamespace(content=content)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def llm_client():
+    client = SharedLLMClient()
+    yield client
+    client.close()
+
+
+def run_concurrently(llm_client, stub, kwargs_list):
+    results = [None] * len(kwargs_list)
+    errors = [None] * len(kwargs_list)
+
+    def worker(i, kwargs):
+        try:
+            results[i] = llm_client.complete(**kwargs)
+        except BaseException as e:
+            errors[i] = e
+
+    threads = [
+        threading.Thread(target=worker, args=(i, kwargs))
+        for i, kwargs in enumerate(kwargs_list)
+    ]
+    for thread in threads:
+        thread.start()
+
+    deadline = time.time() + 5
+    while llm_client.get_stats()["requests"] < len(kwargs_list) and time.time() < deadline:
+        time.sleep(0.01)
+    stub.release.set()
+
+    for thread in threads:
+        thread.join(timeout=5)
+    return results, errors
+
+
+def request(content="claim", temperature=0.3):
+    return {
+        "model": "test-model",
+        "messages": [{"role": "user", "content": content}],
+        "temperature": temperature,
+    }
+
+
+def test_identical_concurrent_calls_are_coalesced(llm_client):
+    stub = BlockingCreate()
+    llm_client.client.chat.completions.create = stub
+
+    results, errors = run_concurrently(llm_client, stub, [request()] * 5)
+
+    assert errors == [None] * 5
+    assert results == ["test-model:claim:0.3"] * 5
+    assert stub.calls == 1
+
+    stats = llm_client.get_stats()
+    assert stats["requests"] == 5
+    assert stats["api_calls"] == 1
+    assert stats["coalesced"] == 4
+    assert stats["coalescing_ratio"] == pytest.approx(0.8)
+    assert llm_client._inflight == {}
+
+
+def test_different_params_are_not_coalesced(llm_client):
+    stub = BlockingCreate()
+    llm_client.client.chat.completions.create = stub
+
+    results, errors = run_concurrently(
+        llm_client,
+        stub,
+        [request(temperature=0.3), request(temperature=0.7), request(content="other")]
+    )
+
+    assert errors == [None] * 3
+    assert sorted(results) == sorted([
+        "test-model:claim:0.3",
+        "test-model:claim:0.7",
+        "test-model:other:0.3",
+    ])
+    assert stub.calls == 3
+
+    stats = llm_client.get_stats()
+    assert stats["api_calls"] == 3
+    assert stats["coalesced"] == 0
+    assert stats["coalescing_ratio"] == 0.0
+    assert llm_client._inflight == {}
+
+
+def test_leader_error_is_propagated_to_followers(llm_client):
+    failure = ValueError("upstream failure")
+    stub = BlockingCreate(error=failure)
+    llm_client.client.chat.completions.create = stub
+
+    results, errors = run_concurrently(llm_client, stub, [request()] * 4)
+
+    assert results == [None] * 4
+    assert stub.calls == 1
+    assert sum(e is failure for e in errors) == 1
+    followers = [e for e in errors if e is not failure]
+    assert len(followers) == 3
+    for error in followers:
+        assert isinstance(error, RuntimeError)
+        assert error.__cause__ is failure
+        assert "upstream failure" in str(error)
+    assert llm_client._inflight == {}
+
+
+def test_aborted_leader_fails_followers(llm_client):
+    stub = BlockingCreate(error=KeyboardInterrupt())
+    llm_client.client.chat.completions.create = stub
+
+    results, errors = run_concurrently(llm_client, stub, [request()] * 3)
+
+    assert results == [None] * 3
+    assert sum(isinstance(e, KeyboardInterrupt) for e in errors) == 1
+    assert sum(isinstance(e, RuntimeError) for e in errors) == 2
+    assert llm_client._inflight == {}
+
+
+def test_follower_times_out_when_leader_hangs(llm_client):
+    stub = BlockingCreate()
+    llm_client.client.chat.completions.create = stub
+    llm_client.follower_timeout = 0.05
+
+    leader = threading.Thread(target=llm_client.complete, kwargs=request())
+    leader.start()
+    while stub.calls == 0:
+        time.sleep(0.01)
+
+    with pytest.raises(TimeoutError):
+        llm_client.complete(**request())
+
+    stub.release.set()
+    leader.join(timeout=5)
+    assert llm_client._inflight == {}
+
+
+def test_unserializable_params_bypass_coalescing(llm_client):
+    stub = BlockingCreate()
+    stub.release.set()
+    llm_client.client.chat.completions.create = stub
+
+    marker = object()
+    result = llm_client.complete(
+        model="test-model",
+        messages=[{"role": "user", "content": "claim"}],
+        temperature=0.3,
+        extra=marker
+    )
+
+    assert result == "test-model:claim:0.3"
+    assert stub.calls == 1
+    stats = llm_client.get_stats()
+    assert stats["requests"] == 1
+    assert stats["api_calls"] == 1
+    assert stats["coalesced"] == 0
+    assert llm_client._inflight == {}
+
+
+def test_connection_reuse_tracks_live_streams(llm_client):
+    class Stream:
+        pass
+
+    def response(stream):
+        return types.SimpleNamespace(extensions={"network_stream": stream})
+
+    first = Stream()
+    llm_client._track_connection(response(first))
+    llm_client._track_connection(response(first))
+    del first
+    second = Stream()
+    llm_client._track_connection(response(second))
+
+    stats = llm_client.get_stats()
+    assert stats["http_requests"] == 3
+    assert stats["new_connections"] == 2
+    assert stats["connection_reuse_ratio"] == pytest.approx(1 / 3)